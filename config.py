@@ -19,6 +19,8 @@ PLAYER_MOVE_SPEED = 5.0  # Horizontal movement speed
 PLAYER_JUMP_SPEED = 20.0  # Vertical jump velocity
 PLAYER_MAX_HEALTH = 3  # Maximum number of hearts
 KILL_PLANE_Y = -200  # Y coordinate below which player dies
+PHYSICS_STEP = 1 / 60  # Fixed physics time step (seconds)
+MAX_FRAME_TIME = 1 / 30  # Longest frame simulated; longer hitches are clamped (seconds)
 
 # Animation settings
 ANIMATION_RATE = 0.12  # Time between animation frames (seconds)
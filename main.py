@@ -5,6 +5,7 @@ It creates the main window and displays the start menu.
 
 import arcade
 from src.views.start_view import StartView
+from src.atlas import get_game_atlas
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE
 
 
@@ -16,6 +17,9 @@ def main():
     # Create the game window with fixed size
     window = arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, resizable=False)
     
+    # Pack every game texture into the atlas up front to avoid stutter on first use
+    get_game_atlas()
+    
     # Create and show the start menu view
     start_view = StartView()
     window.show_view(start_view)
@@ -25,4 +29,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
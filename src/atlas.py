@@ -0,0 +1,54 @@
+"""
+Shared texture atlas for gameplay sprites
+
+This module owns the single texture atlas used by every gameplay
+SpriteList. All game art from config.py is packed into it up front so
+the atlas never has to grow (and rebuild) in the middle of a level.
+"""
+
+import arcade
+from config import (
+    COIN_TEXTURE, GROUND_TEXTURE, PLATFORM_TEXTURE, ENEMY_TEXTURE,
+    LAVA_TEXTURE, WATER_TEXTURE, FLAG_TEXTURE,
+)
+from src.sprites.player import PlayerSprite
+from src.sprites.texture_registry import get_tiled
+from src.levels.level_data import GROUND_STRIPS
+
+# Size of the atlas texture in pixels (large enough for all game art)
+ATLAS_SIZE = (2048, 2048)
+
+# Level textures loaded from disk by path
+LEVEL_TEXTURES = (
+    COIN_TEXTURE, GROUND_TEXTURE, PLATFORM_TEXTURE, ENEMY_TEXTURE,
+    LAVA_TEXTURE, WATER_TEXTURE, FLAG_TEXTURE,
+)
+
+_game_atlas = None
+
+
+def get_game_atlas():
+    """
+    Return the gameplay texture atlas, building it on first use.
+    
+    The atlas needs an OpenGL context, so it is created lazily once the
+    window exists. Both player models, every level texture and every
+    ground strip texture are added when it is built.
+    
+    Returns:
+        arcade.DefaultTextureAtlas: Atlas shared by all gameplay sprite lists
+    """
+    global _game_atlas
+    if _game_atlas is None:
+        _game_atlas = arcade.DefaultTextureAtlas(ATLAS_SIZE)
+        textures = PlayerSprite.preload("male") + PlayerSprite.preload("female")
+        # Sprites created from a path read the default texture cache, so load
+        # level textures through it to make those lookups cache hits
+        for path in LEVEL_TEXTURES:
+            textures.append(arcade.texture.default_texture_cache.load_or_get_texture(path))
+        tile_counts = {count for strips in GROUND_STRIPS for _, _, count in strips}
+        for count in sorted(tile_counts):
+            textures.append(get_tiled(GROUND_TEXTURE, count))
+        for texture in textures:
+            _game_atlas.add(texture)
+    return _game_atlas
@@ -4,8 +4,11 @@ Patrolling enemy sprite
 This module defines the EnemySprite class which handles:
 - Enemy positioning and movement
 - Patrol behavior (moving back and forth between boundaries)
+- Batched patrol updates for all enemies in a level (EnemyManager)
 """
 
+from array import array
+
 import arcade
 from config import ENEMY_TEXTURE, ENEMY_SCALING
 
@@ -14,8 +17,9 @@ class EnemySprite(arcade.Sprite):
     """
     Enemy sprite that patrols between two x-coordinates.
     
-    The enemy moves horizontally back and forth, reversing direction
-    when it reaches the patrol boundaries.
+    The enemy moves horizontally back and forth, turning around
+    when it reaches the patrol boundaries. Movement is driven by
+    EnemyManager, which updates all enemies of a level together.
     """
     
     def __init__(self, spec):
@@ -23,36 +27,62 @@ class EnemySprite(arcade.Sprite):
         Initialize the enemy sprite.
         
         Args:
-            spec (dict): Dictionary containing:
-                - "position": (x, y) tuple for starting position
-                - "patrol_min_x": Left boundary of patrol area
-                - "patrol_max_x": Right boundary of patrol area
-                - "speed": Horizontal movement speed
+            spec (EnemySpec): Enemy configuration containing:
+                - position: (x, y) tuple for starting position
+                - patrol_min_x: Left boundary of patrol area
+                - patrol_max_x: Right boundary of patrol area
+                - speed: Horizontal movement speed
         """
         super().__init__(ENEMY_TEXTURE, scale=ENEMY_SCALING)
-        self.center_x, self.center_y = spec["position"]
-        self.patrol_min_x = spec["patrol_min_x"]
-        self.patrol_max_x = spec["patrol_max_x"]
-        self.change_x = spec["speed"]
+        self.center_x, self.center_y = spec.position
+        self.patrol_min_x = spec.patrol_min_x
+        self.patrol_max_x = spec.patrol_max_x
+        self.change_x = spec.speed
+        
+        # Start inside the patrol area, at the nearest bound if spawned outside
+        self.center_x = min(max(self.center_x, self.patrol_min_x), self.patrol_max_x)
 
-    def update(self, delta_time: float = 1 / 60):
+
+class EnemyManager:
+    """
+    Updates the patrol movement of every enemy in a level in one pass.
+    
+    Patrol state is kept column-wise in flat arrays (one entry per enemy)
+    instead of on each sprite, so a frame is a single tight loop rather
+    than one method call per enemy. Motion is a triangle wave over the
+    distance travelled, folded back into the patrol area, so there are
+    no per-frame direction checks.
+    """
+    
+    def __init__(self, enemies):
         """
-        Update enemy position and handle patrol boundaries.
+        Initialize the manager from already-placed enemy sprites.
         
-        Moves the enemy horizontally and reverses direction when
-        it reaches the patrol boundaries.
+        Args:
+            enemies (Iterable[EnemySprite]): Enemies to update; the manager
+                owns their patrol state from here on
+        """
+        # Enemies with an empty patrol area never move, so leave them out
+        self.sprites = [e for e in enemies if e.patrol_max_x > e.patrol_min_x]
+        self.travel = array("d", (e.center_x - e.patrol_min_x for e in self.sprites))
+        self.speed = array("d", (e.change_x for e in self.sprites))
+        self.span = array("d", (e.patrol_max_x - e.patrol_min_x for e in self.sprites))
+        self.period = array("d", (2 * span for span in self.span))
+        self.max_x = array("d", (e.patrol_max_x for e in self.sprites))
+
+    def update(self, delta_time: float = 1 / 60):
+        """
+        Move every enemy along its patrol route.
         
         Args:
             delta_time (float): Time elapsed since last frame
         """
-        # Move enemy horizontally
-        self.center_x += self.change_x
-        
-        # Reverse direction if enemy reaches left boundary
-        if self.center_x < self.patrol_min_x:
-            self.center_x = self.patrol_min_x
-            self.change_x *= -1
-        # Reverse direction if enemy reaches right boundary
-        elif self.center_x > self.patrol_max_x:
-            self.center_x = self.patrol_max_x
-            self.change_x *= -1
\ No newline at end of file
+        frames = delta_time * 60  # Speeds are in pixels per 1/60 s frame
+        travel = self.travel
+        for i, (sprite, speed, period, span, max_x) in enumerate(
+            zip(self.sprites, self.speed, self.period, self.span, self.max_x)
+        ):
+            t = (travel[i] + speed * frames) % period
+            travel[i] = t
+            # Fold back into [patrol_min_x, patrol_max_x]
+            sprite.center_x = max_x - abs(t - span)
@@ -2,18 +2,36 @@
 Hazard sprites - Lava and Water that damage the player
 
 This module defines hazard sprites that damage the player on contact.
-Hazards have animated effects to make them visually distinct.
+Hazards have animated effects to make them visually distinct, and
+HazardGroup animates all hazards of a level together.
 """
 
+import math
+from array import array
+
 import arcade
 from config import LAVA_TEXTURE, WATER_TEXTURE, HAZARD_SCALING
 
+# One period of sin() sampled in 256 steps; index with "& 255" to wrap
+_SIN_LUT = array("f", [math.sin(2 * math.pi * i / 256) for i in range(256)])
+# LUT steps per second for an angular frequency of 1 rad/s
+_LUT_STEPS_PER_RAD = 256 / (2 * math.pi)
+
+# Animation frequencies in rad/s
+LAVA_PULSE_FREQ = 2.0
+WATER_BOB_FREQ = 4.0
+
+# LUT steps per second for each animation
+_LAVA_LUT_RATE = LAVA_PULSE_FREQ * _LUT_STEPS_PER_RAD
+_WATER_LUT_RATE = WATER_BOB_FREQ * _LUT_STEPS_PER_RAD
+
 
 class LavaHazard(arcade.Sprite):
     """
     Lava hazard that damages the player on contact.
     
-    Features a pulsing alpha animation to create a glowing effect.
+    Features a pulsing alpha animation (driven by HazardGroup) to create
+    a glowing effect.
     """
     
     def __init__(self, position, width=128):
@@ -27,29 +45,14 @@ class LavaHazard(arcade.Sprite):
         super().__init__(LAVA_TEXTURE, scale=HAZARD_SCALING)
         self.center_x, self.center_y = position
         self.width = width
-        self.time = 0.0
-        self.base_y = position[1]
-        
-    def update_animation(self, delta_time: float):
-        """
-        Update lava animation with pulsing alpha effect.
-        
-        Creates a glowing effect by oscillating the alpha value
-        between 200 and 255.
-        
-        Args:
-            delta_time (float): Time elapsed since last frame
-        """
-        self.time += delta_time
-        # Pulse alpha between 200 and 255 for glowing effect
-        self.alpha = int(200 + 55 * abs(int(self.time * 4) % 2))
 
 
 class WaterHazard(arcade.Sprite):
     """
     Water hazard that damages the player on contact.
     
-    Features a vertical bobbing animation to simulate water movement.
+    Features a vertical bobbing animation (driven by HazardGroup) to
+    simulate water movement.
     """
     
     def __init__(self, position, width=128):
@@ -63,20 +66,46 @@ class WaterHazard(arcade.Sprite):
         super().__init__(WATER_TEXTURE, scale=HAZARD_SCALING)
         self.center_x, self.center_y = position
         self.width = width
-        self.time = 0.0
-        self.base_y = position[1]
-        
-    def update_animation(self, delta_time: float):
+        self.base_y = position[1]  # Rest height the bobbing is centered on
+
+
+class HazardGroup:
+    """
+    Animates every hazard in a level in one pass.
+    
+    Hazards of the same kind share one animation clock, so each frame
+    the sine table is read once per kind and the result is written to
+    every sprite, instead of animating each hazard separately.
+    """
+    
+    def __init__(self, hazards):
         """
-        Update water animation with vertical bobbing effect.
+        Initialize the group from already-placed hazard sprites.
         
-        Creates a wave-like motion by oscillating the y position
-        up and down from the base position.
+        Args:
+            hazards (Iterable[arcade.Sprite]): LavaHazard and WaterHazard
+                sprites to animate
+        """
+        self.time = 0.0
+        self.lava = [h for h in hazards if isinstance(h, LavaHazard)]
+        self.water = [h for h in hazards if isinstance(h, WaterHazard)]
+        self.water_base_y = array("d", (h.base_y for h in self.water))
+
+    def update(self, delta_time: float):
+        """
+        Advance the shared clock and animate all hazards.
         
         Args:
             delta_time (float): Time elapsed since last frame
         """
         self.time += delta_time
-        # Create bobbing effect by offsetting y position
-        offset = int(3 * (self.time * 2) % 2)
-        self.center_y = self.base_y + offset
\ No newline at end of file
+        
+        # Pulse alpha between 200 and 255 for every lava pool
+        alpha = 200 + int(27.5 * (1 + _SIN_LUT[int(self.time * _LAVA_LUT_RATE) & 255]))
+        for sprite in self.lava:
+            sprite.alpha = alpha
+        
+        # Bob every water pool around its base position
+        offset = 3 * _SIN_LUT[int(self.time * _WATER_LUT_RATE) & 255]
+        for sprite, base_y in zip(self.water, self.water_base_y):
+            sprite.center_y = base_y + offset
@@ -4,11 +4,28 @@ Player Sprite with gender selection support
 This module defines the PlayerSprite class which handles:
 - Character gender selection (male/female)
 - Animation states (idle, walk, jump)
-- Sprite flipping based on movement direction
+- Left-facing textures based on movement direction
 """
 
 import arcade
-from config import *
+from config import (
+    CHARACTER_SCALING, ANIMATION_RATE,
+    PLAYER_MALE_IDLE, PLAYER_MALE_JUMP, PLAYER_MALE_WALK,
+    PLAYER_FEMALE_IDLE, PLAYER_FEMALE_JUMP, PLAYER_FEMALE_WALK,
+)
+from src.sprites.texture_registry import get, get_mirrored
+
+
+def _texture_paths(gender):
+    """
+    Return the (idle, jump, walk frames) texture paths for a gender.
+
+    Args:
+        gender (str): "male" or "female"
+    """
+    if gender == "male":
+        return PLAYER_MALE_IDLE, PLAYER_MALE_JUMP, PLAYER_MALE_WALK
+    return PLAYER_FEMALE_IDLE, PLAYER_FEMALE_JUMP, PLAYER_FEMALE_WALK
 
 
 class PlayerSprite(arcade.Sprite):
@@ -19,7 +36,7 @@ class PlayerSprite(arcade.Sprite):
     - Idle animation
     - Walking animation (8 frames)
     - Jumping animation
-    - Automatic sprite flipping based on movement direction
+    - Automatic left/right facing based on movement direction
     """
     
     def __init__(self, gender="female"):
@@ -31,15 +48,17 @@ class PlayerSprite(arcade.Sprite):
         """
         super().__init__(scale=CHARACTER_SCALING)
         
-        # Load textures based on selected gender
-        if gender == "male":
-            self.idle_texture = arcade.load_texture(PLAYER_MALE_IDLE)
-            self.jump_texture = arcade.load_texture(PLAYER_MALE_JUMP)
-            self.walk_textures = [arcade.load_texture(path) for path in PLAYER_MALE_WALK]
-        else:
-            self.idle_texture = arcade.load_texture(PLAYER_FEMALE_IDLE)
-            self.jump_texture = arcade.load_texture(PLAYER_FEMALE_JUMP)
-            self.walk_textures = [arcade.load_texture(path) for path in PLAYER_FEMALE_WALK]
+        # Get shared textures based on selected gender
+        idle_path, jump_path, walk_paths = _texture_paths(gender)
+        self.idle_texture = get(idle_path)
+        self.jump_texture = get(jump_path)
+        self.walk_textures = [get(path) for path in walk_paths]
+        self._num_walk = len(self.walk_textures)
+        
+        # Mirrored copies for facing left, so turning around is just a texture swap
+        self._idle_left = get_mirrored(idle_path)
+        self._jump_left = get_mirrored(jump_path)
+        self._walk_left = [get_mirrored(path) for path in walk_paths]
 
         # Initialize animation state
         self.texture = self.idle_texture
@@ -47,6 +66,24 @@ class PlayerSprite(arcade.Sprite):
         self.cur_walk_frame = 0
         self._frame_time = 0.0
 
+    @staticmethod
+    def preload(gender):
+        """
+        Load every texture for a character model into the shared cache.
+
+        Call this before the player is created so the first frames
+        of movement don't stall on texture loading.
+
+        Args:
+            gender (str): "male" or "female" character model to preload
+            
+        Returns:
+            list: The cached textures for the character model
+        """
+        idle_path, jump_path, walk_paths = _texture_paths(gender)
+        paths = (idle_path, jump_path, *walk_paths)
+        return [get(path) for path in paths] + [get_mirrored(path) for path in paths]
+
     def update_animation(self, delta_time: float = 1 / 60):
         """
         Update player animation based on current state.
@@ -60,21 +97,25 @@ class PlayerSprite(arcade.Sprite):
         Args:
             delta_time (float): Time elapsed since last frame
         """
+        # Read velocities once into locals
+        cx = self.change_x
+        cy = self.change_y
+        
         # Determine facing direction based on horizontal movement
-        if self.change_x < 0:
+        if cx < 0:
             self.facing_right = False
-        elif self.change_x > 0:
+        elif cx > 0:
             self.facing_right = True
+        facing_right = self.facing_right
 
         # Check if player is jumping (has significant vertical velocity)
-        is_jumping = self.change_y > 1 or self.change_y < -1
+        is_jumping = cy > 1 or cy < -1
         # Check if player is moving horizontally
-        is_moving = abs(self.change_x) > 0.1
+        is_moving = cx > 0.1 or cx < -0.1
 
         # Show jump texture when jumping
         if is_jumping:
-            self.texture = self.jump_texture
-            self.flip_h = not self.facing_right
+            self.texture = self.jump_texture if facing_right else self._jump_left
             return
 
         # Handle walking animation
@@ -83,12 +124,11 @@ class PlayerSprite(arcade.Sprite):
             # Advance to next frame when animation rate is exceeded
             if self._frame_time > ANIMATION_RATE:
                 self._frame_time = 0
-                self.cur_walk_frame = (self.cur_walk_frame + 1) % len(self.walk_textures)
-            self.texture = self.walk_textures[self.cur_walk_frame]
-            self.flip_h = not self.facing_right
+                self.cur_walk_frame = (self.cur_walk_frame + 1) % self._num_walk
+            walk_textures = self.walk_textures if facing_right else self._walk_left
+            self.texture = walk_textures[self.cur_walk_frame]
         else:
             # Show idle texture when not moving
-            self.texture = self.idle_texture
-            self.flip_h = not self.facing_right
+            self.texture = self.idle_texture if facing_right else self._idle_left
             self.cur_walk_frame = 0
             self._frame_time = 0
\ No newline at end of file
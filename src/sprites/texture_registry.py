@@ -0,0 +1,82 @@
+"""
+Texture registry - Shared textures keyed by resource path
+
+This module is the single place player, preview and ground strip
+textures are loaded from, so every view and sprite using the same image
+shares one arcade.Texture object and each PNG is decoded only once.
+"""
+
+import arcade
+from PIL import Image
+from config import PLAYER_MALE_IDLE, PLAYER_FEMALE_IDLE
+
+# Loaded textures, keyed by resource path
+_TEXTURES: dict[str, arcade.Texture] = {}
+# Left-facing (mirrored) versions of the loaded textures, keyed by resource path
+_MIRRORED: dict[str, arcade.Texture] = {}
+# Horizontally repeated textures, keyed by (resource path, repeat count)
+_TILED: dict[tuple[str, int], arcade.Texture] = {}
+
+
+def get(path: str) -> arcade.Texture:
+    """
+    Return the texture for a resource path, loading it on first use.
+    
+    Args:
+        path (str): Resource path of the texture
+        
+    Returns:
+        arcade.Texture: Shared texture for the path
+    """
+    texture = _TEXTURES.get(path)
+    if texture is None:
+        texture = _TEXTURES[path] = arcade.load_texture(path)
+    return texture
+
+
+def get_mirrored(path: str) -> arcade.Texture:
+    """
+    Return the left-right mirrored texture for a resource path.
+    
+    The mirrored texture shares image data with the original; only its
+    texture coordinates are flipped.
+    
+    Args:
+        path (str): Resource path of the texture
+        
+    Returns:
+        arcade.Texture: Shared mirrored texture for the path
+    """
+    texture = _MIRRORED.get(path)
+    if texture is None:
+        texture = _MIRRORED[path] = get(path).flip_left_right()
+    return texture
+
+
+def get_tiled(path: str, count: int) -> arcade.Texture:
+    """
+    Return a texture made of an image repeated side by side.
+    
+    Used to draw a row of identical tiles as one wide sprite.
+    
+    Args:
+        path (str): Resource path of the tile texture
+        count (int): Number of times the tile is repeated
+        
+    Returns:
+        arcade.Texture: Shared tiled texture for the path and count
+    """
+    key = (path, count)
+    texture = _TILED.get(key)
+    if texture is None:
+        tile = get(path).image
+        image = Image.new("RGBA", (tile.width * count, tile.height))
+        for i in range(count):
+            image.paste(tile, (i * tile.width, 0))
+        texture = _TILED[key] = arcade.Texture(image, hash=f"{path}|tiled|{count}")
+    return texture
+
+
+# Idle textures used by both the character select previews and the player
+MALE_IDLE = get(PLAYER_MALE_IDLE)
+FEMALE_IDLE = get(PLAYER_FEMALE_IDLE)
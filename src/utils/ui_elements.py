@@ -0,0 +1,134 @@
+"""
+UI elements - Shared textures and sprites for menu effects
+
+This module provides the particle sprite, the gradient background
+texture and sprite, and the box decoration sprites used by the menu
+screens. All particles share one white disc texture, tinted and scaled
+per sprite, so a whole particle system draws as a single SpriteList.
+"""
+
+import arcade
+from PIL import Image
+
+# Radius of the shared particle texture in pixels
+PARTICLE_RADIUS = 8
+
+# White disc texture shared by every particle sprite
+PARTICLE_TEXTURE = arcade.make_circle_texture(
+    PARTICLE_RADIUS * 2, arcade.color.WHITE, name="ui_particle"
+)
+
+# Gradient textures already built, keyed by (band colors, height)
+_GRADIENTS = {}
+
+
+def make_particle_sprite(x, y, radius, color):
+    """
+    Create a round particle sprite.
+    
+    Args:
+        x (float): Center x position
+        y (float): Center y position
+        radius (float): Particle radius in pixels
+        color (tuple): RGB or RGBA tint color
+        
+    Returns:
+        arcade.Sprite: Particle sprite using the shared disc texture
+    """
+    sprite = arcade.Sprite(
+        PARTICLE_TEXTURE,
+        scale=radius / PARTICLE_RADIUS,
+        center_x=x,
+        center_y=y,
+    )
+    sprite.color = color
+    return sprite
+
+
+def get_gradient_texture(colors, height):
+    """
+    Get a texture of horizontal color bands, building it on first use.
+    
+    The texture is one pixel wide and `height` pixels tall, with the
+    bands split evenly from top to bottom. Draw it stretched across the
+    screen to replace one rectangle per band with a single textured quad.
+    
+    Args:
+        colors (tuple): RGB band colors, top band first
+        height (int): Texture height in pixels (normally the screen height)
+        
+    Returns:
+        arcade.Texture: The cached gradient texture
+    """
+    key = (colors, height)
+    texture = _GRADIENTS.get(key)
+    if texture is None:
+        image = Image.new("RGBA", (1, height))
+        bands = len(colors)
+        image.putdata([(*colors[row * bands // height], 255) for row in range(height)])
+        texture = arcade.Texture(image, hash=f"ui_gradient_{key}")
+        _GRADIENTS[key] = texture
+    return texture
+
+
+def make_gradient_sprite(colors, width, height):
+    """
+    Create a sprite showing horizontal color bands over a whole area.
+    
+    Args:
+        colors (tuple): RGB band colors, top band first
+        width (int): Area width in pixels
+        height (int): Area height in pixels
+        
+    Returns:
+        arcade.Sprite: Sprite using the cached gradient texture, stretched
+            over the area with its bottom-left corner at (0, 0)
+    """
+    sprite = arcade.Sprite(
+        get_gradient_texture(colors, height),
+        center_x=width / 2,
+        center_y=height / 2,
+    )
+    sprite.size = width, height
+    return sprite
+
+
+def make_box_sprites(center_x, center_y, width, height, fill_color, border_color, border_width):
+    """
+    Create the sprites for a filled box with a border.
+    
+    The border is made of four thin bars centered on the box edges, the
+    same way arcade.draw_lrbt_rectangle_outline draws it, so the box can
+    live in a SpriteList with other static decorations.
+    
+    Args:
+        center_x (float): Box center x position
+        center_y (float): Box center y position
+        width (int): Box width in pixels
+        height (int): Box height in pixels
+        fill_color (tuple): RGB or RGBA fill color
+        border_color (tuple): RGB or RGBA border color
+        border_width (int): Border thickness in pixels
+        
+    Returns:
+        list: The fill sprite followed by the four border sprites
+    """
+    half_w = width / 2
+    half_h = height / 2
+    return [
+        arcade.SpriteSolidColor(width, height, center_x, center_y, fill_color),
+        # Top and bottom bars span the corners
+        arcade.SpriteSolidColor(
+            width + border_width, border_width, center_x, center_y + half_h, border_color
+        ),
+        arcade.SpriteSolidColor(
+            width + border_width, border_width, center_x, center_y - half_h, border_color
+        ),
+        # Left and right bars
+        arcade.SpriteSolidColor(
+            border_width, height + border_width, center_x - half_w, center_y, border_color
+        ),
+        arcade.SpriteSolidColor(
+            border_width, height + border_width, center_x + half_w, center_y, border_color
+        ),
+    ]
@@ -6,11 +6,69 @@ to choose between male and female character models before starting the game.
 """
 
 import arcade
-from config import (
-    SCREEN_WIDTH, SCREEN_HEIGHT,
-    PLAYER_MALE_IDLE, PLAYER_FEMALE_IDLE
+from arcade.gl import geometry
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+from src.sprites.player import PlayerSprite
+from src.sprites.texture_registry import MALE_IDLE, FEMALE_IDLE
+
+# Gradient background colors, top band first
+BG_COLORS = (
+    (80, 60, 120),   # Light purple
+    (70, 50, 110),   # Medium purple
+    (60, 40, 100),   # Purple
+    (50, 30, 90),    # Dark purple
 )
 
+# Background shader: draws the gradient bands plus the pulsing glow disc and
+# selection ring around the selected character in one full-screen pass
+BG_VERTEX_SHADER = """
+#version 330
+in vec2 in_vert;
+in vec2 in_uv;
+out vec2 v_uv;
+void main() {
+    gl_Position = vec4(in_vert, 0.0, 1.0);
+    v_uv = in_uv;
+}
+"""
+
+BG_FRAGMENT_SHADER = """
+#version 330
+uniform vec2 u_size;          // Screen size in pixels
+uniform vec4 u_bands[4];      // Gradient band colors, top band first
+uniform float u_time;         // Animation time in seconds
+uniform vec2 u_center;        // Center of the selected character
+uniform vec4 u_glow_color;    // Glow disc color (alpha = opacity)
+uniform vec4 u_ring_color;    // Selection ring color
+in vec2 v_uv;
+out vec4 fragColor;
+void main() {
+    vec4 color = u_bands[clamp(int((1.0 - v_uv.y) * 4.0), 0, 3)];
+
+    // Disc radius pulses in whole-pixel steps: 120 + (10..19)
+    float radius = 130.0 + mod(floor(u_time * 8.0), 10.0);
+    float dist = distance(v_uv * u_size, u_center);
+    float disc = 1.0 - smoothstep(radius - 1.0, radius, dist);
+    color.rgb = mix(color.rgb, u_glow_color.rgb, disc * u_glow_color.a);
+
+    // 5 px wide ring centered on radius 130
+    float ring = 1.0 - smoothstep(2.0, 3.0, abs(dist - 130.0));
+    color.rgb = mix(color.rgb, u_ring_color.rgb, ring * u_ring_color.a);
+
+    fragColor = vec4(color.rgb, 1.0);
+}
+"""
+
+# Selectable characters, in selection order:
+# (gender, label, center x, preview texture, highlight color, glow color)
+CHARACTERS = (
+    ("male", "MALE", SCREEN_WIDTH * 0.3, MALE_IDLE, arcade.color.YELLOW, (255, 255, 0, 50)),
+    ("female", "FEMALE", SCREEN_WIDTH * 0.7, FEMALE_IDLE, arcade.color.PINK, (255, 0, 255, 50)),
+)
+
+# Vertical center of the character previews
+CHAR_Y = SCREEN_HEIGHT * 0.5
+
 
 class CharacterSelectView(arcade.View):
     """
@@ -26,13 +84,68 @@ class CharacterSelectView(arcade.View):
         self.selected = 0  # 0 = male, 1 = female
         self.time = 0.0  # Time accumulator for animations
         
-        # Load character preview textures
-        self.male_texture = arcade.load_texture(PLAYER_MALE_IDLE)
-        self.female_texture = arcade.load_texture(PLAYER_FEMALE_IDLE)
+        # Build per-character sprites and labels once, in CHARACTERS order
+        self._labels = []  # Name labels
+        self._preview_list = arcade.SpriteList()
+        for _, label, x, texture, _, _ in CHARACTERS:
+            self._preview_list.append(arcade.Sprite(texture, scale=3.0, center_x=x, center_y=CHAR_Y))
+            
+            self._labels.append(arcade.Text(
+                label,
+                x,
+                CHAR_Y - 150,
+                arcade.color.WHITE,
+                font_size=28,
+                anchor_x="center",
+                bold=True,
+            ))
+        
+        # Background gradient and selection glow are rendered on the GPU
+        self._bg_program = self.window.ctx.program(
+            vertex_shader=BG_VERTEX_SHADER,
+            fragment_shader=BG_FRAGMENT_SHADER,
+        )
+        self._bg_program["u_size"] = SCREEN_WIDTH, SCREEN_HEIGHT
+        self._bg_program["u_bands"] = tuple(
+            c / 255 for color in BG_COLORS for c in (*color, 255)
+        )
+        self._bg_quad = geometry.quad_2d_fs()
+        
+        # Create text objects once; only label colors change per frame
+        self._title = arcade.Text(
+            "SELECT YOUR CHARACTER",
+            SCREEN_WIDTH / 2,
+            SCREEN_HEIGHT * 0.85,
+            arcade.color.YELLOW,
+            font_size=42,
+            anchor_x="center",
+            bold=True,
+        )
+        self._instr1 = arcade.Text(
+            "Use LEFT/RIGHT arrows to select",
+            SCREEN_WIDTH / 2,
+            SCREEN_HEIGHT * 0.2,
+            arcade.color.WHITE,
+            font_size=18,
+            anchor_x="center",
+        )
+        self._instr2 = arcade.Text(
+            "Press ENTER or SPACE to confirm",
+            SCREEN_WIDTH / 2,
+            SCREEN_HEIGHT * 0.15,
+            arcade.color.YELLOW,
+            font_size=20,
+            anchor_x="center",
+            bold=True,
+        )
 
     def on_show(self):
-        """Called when this view is shown. Sets the background color."""
+        """Called when this view is shown. Sets the background color and preloads player textures."""
         arcade.set_background_color((50, 50, 100))  # Dark blue-purple
+        
+        # Warm the player texture cache for both models before one is chosen
+        PlayerSprite.preload("male")
+        PlayerSprite.preload("female")
 
     def on_draw(self):
         """
@@ -48,134 +161,41 @@ class CharacterSelectView(arcade.View):
         """
         self.clear()
         
-        # Draw gradient background (4 horizontal bands)
-        for i in range(4):
-            y = SCREEN_HEIGHT - i * (SCREEN_HEIGHT / 4)
-            colors = [
-                (80, 60, 120),   # Light purple
-                (70, 50, 110),   # Medium purple
-                (60, 40, 100),   # Purple
-                (50, 30, 90)     # Dark purple
-            ]
-            arcade.draw_lrbt_rectangle_filled(
-                0, SCREEN_WIDTH, y - SCREEN_HEIGHT / 4, y, colors[i]
-            )
+        # Draw gradient background and selection glow (single shader pass)
+        _, _, x, _, highlight, glow_color = CHARACTERS[self.selected]
+        self._bg_program["u_time"] = self.time
+        self._bg_program["u_center"] = x, CHAR_Y
+        self._bg_program["u_glow_color"] = tuple(c / 255 for c in glow_color)
+        self._bg_program["u_ring_color"] = tuple(c / 255 for c in highlight)
+        self._bg_quad.render(self._bg_program)
         
         # Title text
-        arcade.draw_text(
-            "SELECT YOUR CHARACTER",
-            SCREEN_WIDTH / 2,
-            SCREEN_HEIGHT * 0.85,
-            arcade.color.YELLOW,
-            font_size=42,
-            anchor_x="center",
-            bold=True,
-        )
-        
-        # Character positions
-        male_x = SCREEN_WIDTH * 0.3
-        female_x = SCREEN_WIDTH * 0.7
-        char_y = SCREEN_HEIGHT * 0.5
-        
-        # Draw glowing selection indicator for male character
-        if self.selected == 0:
-            glow = 10 + abs(int(self.time * 8) % 10)  # Pulsing glow effect
-            arcade.draw_circle_filled(male_x, char_y, 120 + glow, 
-                                     (255, 255, 0, 50))  # Yellow glow
-            arcade.draw_circle_outline(male_x, char_y, 130, 
-                                      arcade.color.YELLOW, 5)
-        
-        # Male character box
-        arcade.draw_lrbt_rectangle_filled(
-            male_x - 100, male_x + 100, char_y - 100, char_y + 100,
-            (255, 255, 255, 200)  # White semi-transparent background
-        )
-        arcade.draw_lrbt_rectangle_outline(
-            male_x - 100, male_x + 100, char_y - 100, char_y + 100,
-            arcade.color.YELLOW if self.selected == 0 else arcade.color.WHITE,
-            3
-        )
+        self._title.draw()
         
-        # Draw male character texture using a temporary sprite
-        male_sprite = arcade.Sprite()
-        male_sprite.texture = self.male_texture
-        male_sprite.scale = 3.0
-        male_sprite.center_x = male_x
-        male_sprite.center_y = char_y
-        temp_list = arcade.SpriteList()
-        temp_list.append(male_sprite)
-        temp_list.draw()
+        # Highlight the label of the selected character only
+        for i, (_, _, _, _, highlight, _) in enumerate(CHARACTERS):
+            self._labels[i].color = highlight if self.selected == i else arcade.color.WHITE
         
-        # Male label
-        arcade.draw_text(
-            "MALE",
-            male_x,
-            char_y - 150,
-            arcade.color.YELLOW if self.selected == 0 else arcade.color.WHITE,
-            font_size=28,
-            anchor_x="center",
-            bold=True,
-        )
-        
-        # Draw glowing selection indicator for female character
-        if self.selected == 1:
-            glow = 10 + abs(int(self.time * 8) % 10)  # Pulsing glow effect
-            arcade.draw_circle_filled(female_x, char_y, 120 + glow, 
-                                     (255, 0, 255, 50))  # Pink glow
-            arcade.draw_circle_outline(female_x, char_y, 130, 
-                                      arcade.color.PINK, 5)
-        
-        # Female character box
-        arcade.draw_lrbt_rectangle_filled(
-            female_x - 100, female_x + 100, char_y - 100, char_y + 100,
-            (255, 255, 255, 200)  # White semi-transparent background
-        )
-        arcade.draw_lrbt_rectangle_outline(
-            female_x - 100, female_x + 100, char_y - 100, char_y + 100,
-            arcade.color.PINK if self.selected == 1 else arcade.color.WHITE,
-            3
-        )
-        
-        # Draw female character texture using a temporary sprite
-        female_sprite = arcade.Sprite()
-        female_sprite.texture = self.female_texture
-        female_sprite.scale = 3.0
-        female_sprite.center_x = female_x
-        female_sprite.center_y = char_y
-        temp_list = arcade.SpriteList()
-        temp_list.append(female_sprite)
-        temp_list.draw()
+        # Character boxes
+        for i, (_, _, x, _, highlight, _) in enumerate(CHARACTERS):
+            arcade.draw_lrbt_rectangle_filled(
+                x - 100, x + 100, CHAR_Y - 100, CHAR_Y + 100,
+                (255, 255, 255, 200)  # White semi-transparent background
+            )
+            arcade.draw_lrbt_rectangle_outline(
+                x - 100, x + 100, CHAR_Y - 100, CHAR_Y + 100,
+                highlight if self.selected == i else arcade.color.WHITE,
+                3
+            )
         
-        # Female label
-        arcade.draw_text(
-            "FEMALE",
-            female_x,
-            char_y - 150,
-            arcade.color.PINK if self.selected == 1 else arcade.color.WHITE,
-            font_size=28,
-            anchor_x="center",
-            bold=True,
-        )
+        # Draw both character previews (over their boxes), then their labels
+        self._preview_list.draw()
+        for label in self._labels:
+            label.draw()
         
         # Instructions
-        arcade.draw_text(
-            "Use LEFT/RIGHT arrows to select",
-            SCREEN_WIDTH / 2,
-            SCREEN_HEIGHT * 0.2,
-            arcade.color.WHITE,
-            font_size=18,
-            anchor_x="center",
-        )
-        
-        arcade.draw_text(
-            "Press ENTER or SPACE to confirm",
-            SCREEN_WIDTH / 2,
-            SCREEN_HEIGHT * 0.15,
-            arcade.color.YELLOW,
-            font_size=20,
-            anchor_x="center",
-            bold=True,
-        )
+        self._instr1.draw()
+        self._instr2.draw()
 
     def on_update(self, delta_time: float):
         """
@@ -204,7 +224,7 @@ class CharacterSelectView(arcade.View):
         elif key in (arcade.key.ENTER, arcade.key.SPACE):
             # Import here to avoid circular import
             from src.views.game_view import GameView
-            gender = "male" if self.selected == 0 else "female"
+            gender = CHARACTERS[self.selected][0]
             game_view = GameView(gender)
             game_view.setup(level_index=0)
             self.window.show_view(game_view)
\ No newline at end of file
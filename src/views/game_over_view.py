@@ -11,7 +11,83 @@ This module defines the GameOverView class which displays:
 
 import arcade
 import random
+from array import array
+from typing import TYPE_CHECKING
 from config import SCREEN_WIDTH, SCREEN_HEIGHT
+from src.utils.ui_elements import make_particle_sprite, make_gradient_sprite, make_box_sprites
+
+if TYPE_CHECKING:
+    from src.views.start_view import StartView
+
+# Gradient background colors, top band first
+WIN_BG_COLORS = ((40, 20, 80), (30, 15, 70), (20, 10, 60), (10, 5, 50))
+LOSE_BG_COLORS = ((80, 30, 30), (70, 25, 25), (60, 20, 20), (50, 15, 15))
+
+# Title font sizes: normal, and pulsed 10% larger
+TITLE_SIZES = (48, int(48 * 1.1))
+
+
+# StartView class, imported on first use like the other view-to-view imports
+_start_view_class = None
+
+
+def _make_start_view() -> "StartView":
+    """
+    Create a start menu view, importing StartView only the first time.
+    
+    Returns:
+        StartView: A new start menu view
+    """
+    global _start_view_class
+    if _start_view_class is None:
+        from src.views.start_view import StartView
+        _start_view_class = StartView
+    return _start_view_class()
+
+
+def _step_particles(sprites, px, py, pvx, pvy, life, max_life, palpha, dt):
+    """
+    Advance every particle by one time step and sync its sprite.
+    
+    Moves particles, respawns the ones whose life ran out, bounces them
+    off the screen edges and fades them out. All state is passed in as
+    flat per-field arrays and updated in place, so the loop only touches
+    locals.
+    
+    Args:
+        sprites (arcade.SpriteList): One sprite per particle
+        px, py (array): Particle positions
+        pvx, pvy (array): Particle velocities in pixels per second
+        life, max_life (array): Remaining and full lifetime in seconds
+        palpha (array): Alpha last given to each sprite
+        dt (float): Time step in seconds
+    """
+    for i, sprite in enumerate(sprites):
+        x = px[i] + pvx[i] * dt
+        y = py[i] + pvy[i] * dt
+        remaining = life[i] - dt
+        
+        if remaining <= 0:
+            x = random.randint(0, SCREEN_WIDTH)
+            y = random.randint(0, SCREEN_HEIGHT)
+            remaining = max_life[i] = random.uniform(1.0, 3.0)  # Start with full life
+        
+        if x < 0 or x > SCREEN_WIDTH:
+            pvx[i] = -pvx[i]
+        if y < 0 or y > SCREEN_HEIGHT:
+            pvy[i] = -pvy[i]
+        
+        px[i] = x
+        py[i] = y
+        life[i] = remaining
+        
+        # Fade out over the particle's lifetime. Life always stays in
+        # (0, max_life] here, so the alpha lands in 0-255 without clamping
+        sprite.position = x, y
+        alpha = int(remaining * 255 / max_life[i])
+        if alpha != palpha[i]:
+            palpha[i] = alpha
+            sprite.alpha = alpha
 
 
 class GameOverView(arcade.View):
@@ -36,90 +112,77 @@ class GameOverView(arcade.View):
         self.score = score
         self.level_name = level_name
         self.time = 0.0  # Time accumulator for animations
-        self.particles = []  # List of particle dictionaries
-        
-        # Create 50 random particles for visual effects
-        for _ in range(50):
-            max_life = random.uniform(1.0, 3.0)
-            self.particles.append({
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(0, SCREEN_HEIGHT),
-                'vx': random.randint(-50, 50),  # Horizontal velocity
-                'vy': random.randint(-50, 50),  # Vertical velocity
-                'life': max_life,  # Start with full life
-                'max_life': max_life,  # Maximum lifetime
-                'size': random.randint(2, 6)  # Particle size
-            })
-
-    def on_show(self):
-        """
-        Called when this view is shown.
-        Sets background color based on win/lose state.
-        """
-        if self.did_win:
-            arcade.set_background_color((20, 20, 60))  # Dark blue for victory
-        else:
-            arcade.set_background_color((60, 20, 20))  # Dark red for defeat
-
-    def on_draw(self):
-        self.clear()
         
-        if self.did_win:
-            colors = [(40, 20, 80), (30, 15, 70), (20, 10, 60), (10, 5, 50)]
-        else:
-            colors = [(80, 30, 30), (70, 25, 25), (60, 20, 20), (50, 15, 15)]
+        # Gradient background as one screen-sized sprite
+        self._background = arcade.SpriteList()
+        self._background.append(make_gradient_sprite(
+            WIN_BG_COLORS if did_win else LOSE_BG_COLORS, SCREEN_WIDTH, SCREEN_HEIGHT
+        ))
         
-        for i in range(4):
-            y = SCREEN_HEIGHT - i * (SCREEN_HEIGHT / 4)
-            arcade.draw_lrbt_rectangle_filled(
-                0, SCREEN_WIDTH, y - SCREEN_HEIGHT / 4, y, colors[i]
-            )
+        # Particle state is stored column-wise, one flat array per field
+        # (one entry per particle), instead of one dictionary per particle
+        count = 50
+        self.px = array("d", (random.randint(0, SCREEN_WIDTH) for _ in range(count)))
+        self.py = array("d", (random.randint(0, SCREEN_HEIGHT) for _ in range(count)))
+        self.pvx = array("d", (random.randint(-50, 50) for _ in range(count)))  # Horizontal velocity
+        self.pvy = array("d", (random.randint(-50, 50) for _ in range(count)))  # Vertical velocity
+        self.max_life = array("d", (random.uniform(1.0, 3.0) for _ in range(count)))
+        self.life = array("d", self.max_life)  # Start with full life
+        self.psize = array("d", (random.randint(2, 6) for _ in range(count)))  # Particle size
+        self.palpha = array("B", (255 for _ in range(count)))  # Alpha last given to each sprite
         
-        for p in self.particles:
-            # Clamp alpha to valid range (0-255)
-            life_ratio = max(0.0, min(1.0, p['life'] / p['max_life'] if p['max_life'] > 0 else 0.0))
-            alpha = int(life_ratio * 255)
-            alpha = max(0, min(255, alpha))  # Ensure alpha is in valid range
-            if self.did_win:
-                color = (255, 255, 0, alpha)
-            else:
-                color = (255, 100, 0, alpha)
-            arcade.draw_circle_filled(p['x'], p['y'], p['size'], color)
-        
-        title = "🎉 VICTORY! 🎉" if self.did_win else "💔 GAME OVER 💔"
-        title_color = arcade.color.GOLD if self.did_win else arcade.color.RED
-        
-        pulse = 1.0 + 0.1 * abs(int(self.time * 4) % 2)
-        shadow_size = int(48 * pulse) + 2
-        
-        arcade.draw_text(
-            title,
-            SCREEN_WIDTH / 2 + 4,
-            SCREEN_HEIGHT * 0.65 - 4,
-            (0, 0, 0, 150),
-            font_size=shadow_size,
-            anchor_x="center",
-            bold=True,
-        )
+        # One sprite per particle, drawn in a single batch
+        particle_color = (255, 255, 0) if did_win else (255, 100, 0)
+        self.particle_sprites = arcade.SpriteList()
+        for x, y, size in zip(self.px, self.py, self.psize):
+            self.particle_sprites.append(
+                make_particle_sprite(x, y, size, particle_color)
+            )
         
-        arcade.draw_text(
-            title,
-            SCREEN_WIDTH / 2,
-            SCREEN_HEIGHT * 0.65,
-            title_color,
-            font_size=int(48 * pulse),
-            anchor_x="center",
-            bold=True,
+        # Create text objects once. The title pulses between two sizes, so
+        # each size gets its own (shadow, title) pair instead of resizing one
+        title = "🎉 VICTORY! 🎉" if did_win else "💔 GAME OVER 💔"
+        title_color = arcade.color.GOLD if did_win else arcade.color.RED
+        self._title_texts = tuple(
+            (
+                arcade.Text(
+                    title,
+                    SCREEN_WIDTH / 2 + 4,
+                    SCREEN_HEIGHT * 0.65 - 4,
+                    (0, 0, 0, 150),
+                    font_size=size + 2,
+                    anchor_x="center",
+                    bold=True,
+                ),
+                arcade.Text(
+                    title,
+                    SCREEN_WIDTH / 2,
+                    SCREEN_HEIGHT * 0.65,
+                    title_color,
+                    font_size=size,
+                    anchor_x="center",
+                    bold=True,
+                ),
+            )
+            for size in TITLE_SIZES
         )
         
-        if self.did_win:
+        if did_win:
             message = "You collected all coins and reached the goal!"
             msg_color = arcade.color.YELLOW
         else:
             message = "Better luck next time, adventurer!"
             msg_color = arcade.color.ORANGE
         
-        arcade.draw_text(
+        # Stats box (fill + border) drawn from one sprite list
+        box_y = SCREEN_HEIGHT * 0.4
+        self._deco = arcade.SpriteList()
+        self._deco.extend(make_box_sprites(
+            SCREEN_WIDTH / 2, box_y, 500, 120,
+            (255, 255, 255, 200), title_color, 4,
+        ))
+        
+        self._message = arcade.Text(
             message,
             SCREEN_WIDTH / 2,
             SCREEN_HEIGHT * 0.55,
@@ -128,93 +191,101 @@ class GameOverView(arcade.View):
             anchor_x="center",
             italic=True,
         )
-        
-        box_y = SCREEN_HEIGHT * 0.4
-        box_width = 500
-        box_height = 120
-        
-        arcade.draw_lrbt_rectangle_filled(
-            SCREEN_WIDTH / 2 - box_width / 2,
-            SCREEN_WIDTH / 2 + box_width / 2,
-            box_y - box_height / 2,
-            box_y + box_height / 2,
-            (255, 255, 255, 200)
-        )
-        
-        arcade.draw_lrbt_rectangle_outline(
-            SCREEN_WIDTH / 2 - box_width / 2,
-            SCREEN_WIDTH / 2 + box_width / 2,
-            box_y - box_height / 2,
-            box_y + box_height / 2,
-            title_color,
-            4
-        )
-        
-        arcade.draw_text(
-            f"📍 Level: {self.level_name}",
+        self._box_texts = [
+            arcade.Text(
+                f"📍 Level: {level_name}",
+                SCREEN_WIDTH / 2,
+                box_y + 30,
+                arcade.color.BLACK,
+                font_size=22,
+                anchor_x="center",
+                bold=True,
+            ),
+            arcade.Text(
+                f"🪙 Coins Collected: {score}",
+                SCREEN_WIDTH / 2,
+                box_y - 10,
+                arcade.color.ORANGE,
+                font_size=20,
+                anchor_x="center",
+                bold=True,
+            ),
+        ]
+        self._prompt = arcade.Text(
+            "Press ENTER to return to menu",
             SCREEN_WIDTH / 2,
-            box_y + 30,
-            arcade.color.BLACK,
+            SCREEN_HEIGHT * 0.2,
+            arcade.color.WHITE,
             font_size=22,
             anchor_x="center",
             bold=True,
         )
         
-        arcade.draw_text(
-            f"🪙 Coins Collected: {self.score}",
-            SCREEN_WIDTH / 2,
-            box_y - 10,
-            arcade.color.ORANGE,
-            font_size=20,
-            anchor_x="center",
-            bold=True,
-        )
-        
-        if int(self.time * 2) % 2:
-            arcade.draw_text(
-                "Press ENTER to return to menu",
-                SCREEN_WIDTH / 2,
-                SCREEN_HEIGHT * 0.2,
-                arcade.color.WHITE,
-                font_size=22,
-                anchor_x="center",
-                bold=True,
-            )
-        
-        if self.did_win:
-            for i in range(4):
-                star_x = SCREEN_WIDTH / 2 + random.randint(-200, 200)
-                star_y = SCREEN_HEIGHT * 0.8 + random.randint(-50, 50)
-                star_size = 3 + int(self.time * 10) % 3
-                arcade.draw_text(
+        # Victory stars are placed once; only their size animates
+        self._stars = []
+        if did_win:
+            for _ in range(4):
+                self._stars.append(arcade.Text(
                     "⭐",
-                    star_x,
-                    star_y,
+                    SCREEN_WIDTH / 2 + random.randint(-200, 200),
+                    SCREEN_HEIGHT * 0.8 + random.randint(-50, 50),
                     arcade.color.YELLOW,
-                    font_size=star_size * 10,
-                )
+                    font_size=30,
+                ))
+
+    def on_show(self):
+        """
+        Called when this view is shown.
+        Sets background color based on win/lose state.
+        """
+        if self.did_win:
+            arcade.set_background_color((20, 20, 60))  # Dark blue for victory
+        else:
+            arcade.set_background_color((60, 20, 20))  # Dark red for defeat
+
+    def on_draw(self):
+        self.clear()
+        
+        self._background.draw(pixelated=True)
+        
+        self.particle_sprites.draw()
+        
+        # Animation phases for this frame, computed once
+        t = self.time
+        pulse = int(t * 4) & 1  # Index into TITLE_SIZES
+        blink = int(t * 2) & 1  # Menu prompt visibility
+        star_size = (3 + int(t * 10) % 3) * 10
+        
+        # Draw the title pair for the current pulse size
+        title_shadow, title_text = self._title_texts[pulse]
+        title_shadow.draw()
+        title_text.draw()
+        
+        self._message.draw()
+        
+        self._deco.draw()
+        
+        for text in self._box_texts:
+            text.draw()
+        
+        if blink:
+            self._prompt.draw()
+        
+        for star in self._stars:
+            if star.font_size != star_size:
+                star.font_size = star_size
+            star.draw()
 
     def on_update(self, delta_time: float):
         self.time += delta_time
         
-        for p in self.particles:
-            p['x'] += p['vx'] * delta_time
-            p['y'] += p['vy'] * delta_time
-            p['life'] -= delta_time
-            
-            if p['life'] <= 0:
-                p['x'] = random.randint(0, SCREEN_WIDTH)
-                p['y'] = random.randint(0, SCREEN_HEIGHT)
-                p['max_life'] = random.uniform(1.0, 3.0)
-                p['life'] = p['max_life']  # Start with full life
-            
-            if p['x'] < 0 or p['x'] > SCREEN_WIDTH:
-                p['vx'] *= -1
-            if p['y'] < 0 or p['y'] > SCREEN_HEIGHT:
-                p['vy'] *= -1
+        _step_particles(
+            self.particle_sprites,
+            self.px, self.py, self.pvx, self.pvy,
+            self.life, self.max_life, self.palpha,
+            delta_time,
+        )
 
     def on_key_press(self, key, modifiers):
         if key == arcade.key.ENTER:
-            from src.views.start_view import StartView
-            start_view = StartView()
-            self.window.show_view(start_view)
\ No newline at end of file
+            self.window.show_view(_make_start_view())
\ No newline at end of file
@@ -10,12 +10,17 @@ This module defines the GameView class which handles:
 - Sound effects and background music
 """
 
+from bisect import bisect_right
+from itertools import accumulate
+
 import arcade
 from config import *
 from src.sprites.player import PlayerSprite
-from src.sprites.enemy import EnemySprite
-from src.sprites.hazards import LavaHazard, WaterHazard
-from src.levels.level_data import LEVELS
+from src.sprites.enemy import EnemySprite, EnemyManager
+from src.sprites.hazards import LavaHazard, WaterHazard, HazardGroup
+from src.levels.level_data import LEVELS, GROUND_STRIPS
+from src.atlas import get_game_atlas
+from src.sprites.texture_registry import get_tiled
 
 # Sky colors (blue sky gradient)
 SKY_TOP = (135, 206, 235)      # Light sky blue
@@ -24,6 +29,30 @@ SKY_BOTTOM = (100, 149, 237)  # Cornflower blue
 CLOUD_COLOR = (255, 255, 255, 220)
 
 
+def _silent():
+    """Stand-in for a sound effect that failed to load."""
+
+
+def _sound_callback(sound, volume):
+    """
+    Build a no-argument function that plays a sound effect.
+    
+    Resolving this once at load time keeps the "did it load?" check out
+    of gameplay code. arcade.play_sound already logs and swallows
+    playback errors.
+    
+    Args:
+        sound (arcade.Sound | None): Loaded sound, or None if loading failed
+        volume (float): Playback volume from 0.0 to 1.0
+        
+    Returns:
+        Callable[[], object]: Plays the sound, or does nothing
+    """
+    if sound is None:
+        return _silent
+    return lambda: arcade.play_sound(sound, volume=volume)
+
+
 class GameView(arcade.View):
     """
     Main game view that handles all gameplay mechanics.
@@ -32,6 +61,10 @@ class GameView(arcade.View):
     and game state (health, score, etc.).
     """
     
+    # Wall sprite lists per level index. Walls never change during play,
+    # so they are built once and reused by every GameView (e.g. on retry)
+    _walls_cache = {}
+    
     def __init__(self, gender="female"):
         """
         Initialize the game view.
@@ -48,6 +81,13 @@ class GameView(arcade.View):
         self.scene = arcade.Scene()  # Container for all sprites
         self.player = None  # Player sprite
         self.physics_engine = None  # Physics engine for platformer mechanics
+        self.enemy_manager = None  # Batched patrol updates for enemies
+        self.hazard_group = None  # Batched hazard animations
+        
+        # Static hazard x-intervals sorted by left edge (collision fast path)
+        self._hazards_by_x = []
+        self._hazard_left = []
+        self._hazard_right_max = []
         
         # Game state
         self.level_index = 0  # Current level (0-indexed)
@@ -56,6 +96,7 @@ class GameView(arcade.View):
         self.total_coins = 0  # Total coins in current level
         self.level_name = ""  # Current level name
         self.invuln_timer = 0.0  # Invulnerability timer after taking damage
+        self._physics_time = 0.0  # Frame time not yet simulated by a physics step
         
         # Sound effects and music
         self.coin_sound = None
@@ -65,9 +106,57 @@ class GameView(arcade.View):
         self.lose_sound = None
         self.music_player = None  # Background music player
         
+        # Sound effect players, resolved once the sounds are loaded
+        self.play_coin = _silent
+        self.play_jump = _silent
+        self.play_hit = _silent
+        self.play_win = _silent
+        self.play_lose = _silent
+        
         # Input state
         self.move_left = False
         self.move_right = False
+        
+        # HUD background strip, drawn from its own sprite list
+        self._hud_bg = arcade.SpriteSolidColor(
+            SCREEN_WIDTH, 40,
+            center_x=SCREEN_WIDTH / 2,
+            center_y=SCREEN_HEIGHT - 20,
+            color=(40, 40, 60, 230),
+        )
+        self._hud_sprites = arcade.SpriteList()
+        self._hud_sprites.append(self._hud_bg)
+        
+        # HUD hearts as one string, re-laid out only when health changes
+        self._hud_hearts_text = arcade.Text(
+            "",
+            20,
+            SCREEN_HEIGHT - 32,
+            arcade.color.RED,
+            font_size=24,
+        )
+        
+        # HUD coin counter and level label
+        self._coin_text = arcade.Text(
+            "",
+            200,
+            SCREEN_HEIGHT - 30,
+            arcade.color.YELLOW,
+            font_size=20,
+            bold=True,
+        )
+        self._level_text = arcade.Text(
+            "",
+            SCREEN_WIDTH - 250,
+            SCREEN_HEIGHT - 30,
+            arcade.color.WHITE,
+            font_size=18,
+        )
+        
+        # Values the HUD texts currently show; texts are only rebuilt when these change
+        self._hud_health = None
+        self._hud_coins = None  # (score, total coins)
+        self._hud_level_name = None
 
         # Sky background: cloud positions (x, y) for simple cloud shapes
         self._clouds = [
@@ -87,64 +176,63 @@ class GameView(arcade.View):
         """
         self.level_index = level_index
         
-        # Create new scene with sprite lists
+        # Create new scene with sprite lists (all sharing the game atlas)
+        atlas = get_game_atlas()
         self.scene = arcade.Scene()
-        self.scene.add_sprite_list("Player")
-        self.scene.add_sprite_list("Walls", use_spatial_hash=True)  # Spatial hash for collision optimization
-        self.scene.add_sprite_list("Coins", use_spatial_hash=True)
-        self.scene.add_sprite_list("Goal")
-        self.scene.add_sprite_list("Enemies")
-        self.scene.add_sprite_list("Hazards")
+        self.scene.add_sprite_list("Player", sprite_list=arcade.SpriteList(atlas=atlas))
+        self.scene.add_sprite_list(  # Built once per level, reused on retry
+            "Walls", sprite_list=self._get_walls(level_index)
+        )
+        self.scene.add_sprite_list("Coins", sprite_list=arcade.SpriteList(atlas=atlas))
+        self.scene.add_sprite_list("Goal", sprite_list=arcade.SpriteList(atlas=atlas))
+        self.scene.add_sprite_list("Enemies", sprite_list=arcade.SpriteList(atlas=atlas))
+        self.scene.add_sprite_list("Hazards", sprite_list=arcade.SpriteList(atlas=atlas))
 
         # Load level data
         level = LEVELS[level_index]
-        self.level_name = level["name"]
+        self.level_name = level.name
 
-        # Create and position player
+        # Create and position player (textures come from the shared cache)
+        PlayerSprite.preload(self.gender)
         self.player = PlayerSprite(self.gender)
-        self.player.center_x, self.player.center_y = level["player_start"]
+        self.player.center_x, self.player.center_y = level.player_start
         self.scene.add_sprite("Player", self.player)
 
-        # Create ground segments (continuous ground tiles)
-        for start_x, end_x, y in level["ground_segments"]:
-            for x in range(start_x, end_x, 64):  # 64 pixel tile spacing
-                ground = arcade.Sprite(GROUND_TEXTURE, TILE_SCALING)
-                ground.center_x = x
-                ground.center_y = y
-                self.scene.add_sprite("Walls", ground)
-
-        # Create platforms (individual platform tiles)
-        for x, y in level["platforms"]:
-            platform = arcade.Sprite(PLATFORM_TEXTURE, TILE_SCALING)
-            platform.center_x = x
-            platform.center_y = y
-            self.scene.add_sprite("Walls", platform)
-
         # Create coins (collectibles)
-        for x, y in level["coins"]:
+        for x, y in level.coins:
             coin = arcade.Sprite(COIN_TEXTURE, COIN_SCALING)
             coin.center_x = x
             coin.center_y = y
             self.scene.add_sprite("Coins", coin)
-        self.total_coins = len(level["coins"])
+        self.total_coins = len(level.coins)
 
         # Create goal flag (exit point)
         goal = arcade.Sprite(FLAG_TEXTURE, TILE_SCALING * 1.5)
-        goal.center_x, goal.center_y = level["goal_position"]
+        goal.center_x, goal.center_y = level.goal_position
         self.scene.add_sprite("Goal", goal)
 
         # Create enemies with patrol behavior
-        for enemy_spec in level["enemies"]:
+        for enemy_spec in level.enemies:
             enemy = EnemySprite(enemy_spec)
             self.scene.add_sprite("Enemies", enemy)
+        self.enemy_manager = EnemyManager(self.scene["Enemies"])
         
         # Create hazards (lava and water)
-        for hazard_spec in level.get("hazards", []):
-            if hazard_spec["type"] == "lava":
-                hazard = LavaHazard(hazard_spec["position"], hazard_spec["width"])
+        for hazard_spec in level.hazards:
+            if hazard_spec.type == "lava":
+                hazard = LavaHazard(hazard_spec.position, hazard_spec.width)
             else:
-                hazard = WaterHazard(hazard_spec["position"], hazard_spec["width"])
+                hazard = WaterHazard(hazard_spec.position, hazard_spec.width)
             self.scene.add_sprite("Hazards", hazard)
+        self.hazard_group = HazardGroup(self.scene["Hazards"])
+        # Hazards never move sideways, so sort their x-intervals once per level
+        self._hazards_by_x = sorted(self.scene["Hazards"], key=lambda h: h.left)
+        self._hazard_left = [h.left for h in self._hazards_by_x]
+        # Running max of right edges, so the walk-back stays correct even
+        # when a wide hazard overlaps the ones after it
+        self._hazard_right_max = list(
+            accumulate((h.right for h in self._hazards_by_x), max)
+        )
 
         # Initialize physics engine for platformer mechanics
         self.physics_engine = arcade.PhysicsEnginePlatformer(
@@ -157,6 +245,7 @@ class GameView(arcade.View):
         self.score = 0 if level_index == 0 else self.score
         self.health = PLAYER_MAX_HEALTH if level_index == 0 else self.health
         self.invuln_timer = 0.0
+        self._physics_time = 0.0
         
         # Load sound effects (only once)
         if self.coin_sound is None:
@@ -168,6 +257,11 @@ class GameView(arcade.View):
                 self.lose_sound = arcade.load_sound(LOSE_SOUND)
             except:
                 pass  # Silently fail if sounds can't be loaded
+            self.play_coin = _sound_callback(self.coin_sound, 0.5)
+            self.play_jump = _sound_callback(self.jump_sound, 0.4)
+            self.play_hit = _sound_callback(self.hit_sound, 0.7)
+            self.play_win = _sound_callback(self.win_sound, 0.8)
+            self.play_lose = _sound_callback(self.lose_sound, 0.8)
         
         # Start background music (only on first level)
         if level_index == 0 and self.music_player is None:
@@ -177,6 +271,41 @@ class GameView(arcade.View):
             except:
                 pass  # Silently fail if music can't be loaded
 
+    @classmethod
+    def _get_walls(cls, level_index: int):
+        """
+        Get the wall sprite list for a level, building it on first use.
+        
+        Args:
+            level_index (int): Index of the level (0-based)
+            
+        Returns:
+            arcade.SpriteList: Ground and platform sprites of the level
+        """
+        walls = cls._walls_cache.get(level_index)
+        if walls is not None:
+            return walls
+        
+        # Spatial hash for collision optimization
+        walls = arcade.SpriteList(use_spatial_hash=True, atlas=get_game_atlas())
+
+        # Create ground segments (one wide sprite of repeated tiles per segment)
+        for x, y, tile_count in GROUND_STRIPS[level_index]:
+            ground = arcade.Sprite(get_tiled(GROUND_TEXTURE, tile_count), TILE_SCALING)
+            ground.center_x = x
+            ground.center_y = y
+            walls.append(ground)
+
+        # Create platforms (individual platform tiles)
+        for x, y in LEVELS[level_index].platforms:
+            platform = arcade.Sprite(PLATFORM_TEXTURE, TILE_SCALING)
+            platform.center_x = x
+            platform.center_y = y
+            walls.append(platform)
+        
+        cls._walls_cache[level_index] = walls
+        return walls
+
     def on_draw(self):
         self.clear()
         self._draw_sky_background()
@@ -196,49 +325,30 @@ class GameView(arcade.View):
             arcade.draw_ellipse_filled(cx - 35, cy - 8, 50, 28, CLOUD_COLOR)
             arcade.draw_ellipse_filled(cx + 30, cy - 5, 45, 26, CLOUD_COLOR)
 
-    def _draw_hud(self):
-        hud_y = SCREEN_HEIGHT - 40
-        
-        arcade.draw_lrbt_rectangle_filled(
-            0, SCREEN_WIDTH, hud_y, SCREEN_HEIGHT,
-            (40, 40, 60, 230)
-        )
-        
-        heart_x = 20
-        for i in range(PLAYER_MAX_HEALTH):
-            if i < self.health:
-                color = arcade.color.RED
-                symbol = "❤️"
-            else:
-                color = (100, 100, 100)
-                symbol = "🖤"
-            
-            arcade.draw_text(
-                symbol,
-                heart_x + i * 40,
-                hud_y + 8,
-                color,
-                font_size=24,
+    def _refresh_hud(self):
+        """Rebuild the HUD texts whose values changed since they were last shown."""
+        # Full hearts for remaining health, dark hearts for health lost
+        if self.health != self._hud_health:
+            self._hud_health = self.health
+            self._hud_hearts_text.text = " ".join(
+                ["❤️"] * self.health + ["🖤"] * (PLAYER_MAX_HEALTH - self.health)
             )
         
-        coin_x = 200
-        arcade.draw_text(
-            f"🪙 {self.score}/{self.total_coins}",
-            coin_x,
-            hud_y + 10,
-            arcade.color.YELLOW,
-            font_size=20,
-            bold=True,
-        )
+        coins = (self.score, self.total_coins)
+        if coins != self._hud_coins:
+            self._hud_coins = coins
+            self._coin_text.text = f"🪙 {self.score}/{self.total_coins}"
         
-        level_x = SCREEN_WIDTH - 250
-        arcade.draw_text(
-            f"📍 Level: {self.level_name}",
-            level_x,
-            hud_y + 10,
-            arcade.color.WHITE,
-            font_size=18,
-        )
+        if self.level_name != self._hud_level_name:
+            self._hud_level_name = self.level_name
+            self._level_text.text = f"📍 Level: {self.level_name}"
+
+    def _draw_hud(self):
+        self._refresh_hud()
+        self._hud_sprites.draw()
+        self._hud_hearts_text.draw()
+        self._coin_text.draw()
+        self._level_text.draw()
 
     def _handle_input(self):
         if not self.player:
@@ -250,55 +360,59 @@ class GameView(arcade.View):
             dx += PLAYER_MOVE_SPEED
         self.player.change_x = dx
 
-    def _check_coin_collisions(self):
+    def _check_sprite_collisions(self, delta_time: float):
         if not self.player:
             return
         
-        coins_hit = arcade.check_for_collision_with_list(
-            self.player, self.scene["Coins"]
+        # Coins and enemies share one collision query. Both lists are only a
+        # handful of sprites, so check them directly (method 3): the default
+        # would fall back to a GPU query for the unhashed Enemies list
+        hits = arcade.check_for_collision_with_lists(
+            self.player, (self.scene["Coins"], self.scene["Enemies"]), method=3
         )
+        coins_hit = [sprite for sprite in hits if not isinstance(sprite, EnemySprite)]
+        enemy_hit = len(coins_hit) < len(hits)
         
+        self._check_coin_collisions(coins_hit)
+        self._check_enemy_collisions(delta_time, enemy_hit)
+
+    def _check_coin_collisions(self, coins_hit):
         for coin in coins_hit:
             coin.remove_from_sprite_lists()
             self.score += 1
             
-            if self.coin_sound:
-                try:
-                    arcade.play_sound(self.coin_sound, volume=0.5)
-                except:
-                    pass
+            self.play_coin()
 
-    def _check_enemy_collisions(self, delta_time: float):
-        if not self.player:
-            return
-        
+    def _check_enemy_collisions(self, delta_time: float, enemy_hit: bool):
         self.invuln_timer = max(0.0, self.invuln_timer - delta_time)
         
         if self.invuln_timer > 0:
             return
         
-        hits = arcade.check_for_collision_with_list(self.player, self.scene["Enemies"])
-        
-        if hits:
+        if enemy_hit:
             self.health -= 1
             self.invuln_timer = 1.0
             
             self.player.change_y = PLAYER_JUMP_SPEED / 2
             self.player.change_x *= -1
             
-            if self.hit_sound:
-                try:
-                    arcade.play_sound(self.hit_sound, volume=0.7)
-                except:
-                    pass
+            self.play_hit()
     
     def _check_hazard_collisions(self, delta_time: float):
         if not self.player or self.invuln_timer > 0:
             return
         
-        hazards_hit = arcade.check_for_collision_with_list(
-            self.player, self.scene["Hazards"]
-        )
+        # Only hazards starting left of the player's right edge can overlap;
+        # bisect finds the nearest one and we walk back until no earlier
+        # hazard reaches past the player's left edge
+        hit_box = self.player.hit_box
+        i = bisect_right(self._hazard_left, hit_box.right) - 1
+        hazards_hit = False
+        while i >= 0 and self._hazard_right_max[i] > hit_box.left:
+            if arcade.check_for_collision(self.player, self._hazards_by_x[i]):
+                hazards_hit = True
+                break
+            i -= 1
         
         if hazards_hit:
             self.health -= 1
@@ -306,11 +420,7 @@ class GameView(arcade.View):
             
             self.player.change_y = PLAYER_JUMP_SPEED / 1.5
             
-            if self.hit_sound:
-                try:
-                    arcade.play_sound(self.hit_sound, volume=0.7)
-                except:
-                    pass
+            self.play_hit()
 
     def _check_goal(self):
         if not self.player:
@@ -330,7 +440,7 @@ class GameView(arcade.View):
             return True
         
         level = LEVELS[self.level_index]
-        if self.player.center_y < level.get("kill_plane_y", KILL_PLANE_Y):
+        if self.player.center_y < level.kill_plane_y:
             return True
         
         return False
@@ -339,17 +449,24 @@ class GameView(arcade.View):
         if not self.physics_engine or not self.player:
             return
 
-        self._handle_input()
-        self.physics_engine.update()
-        self.player.update_animation(delta_time)
-        self.scene["Enemies"].update()
-        # Update hazard animations individually
-        for hazard in self.scene["Hazards"]:
-            hazard.update_animation(delta_time)
+        # Clamp long frames (window drags, GC pauses) so a hitch can't
+        # carry the player through walls or hazards
+        delta_time = min(delta_time, MAX_FRAME_TIME)
+        
+        # Run movement and collisions in fixed steps, independent of frame rate
+        self._physics_time += delta_time
+        while self._physics_time >= PHYSICS_STEP:
+            self._physics_time -= PHYSICS_STEP
+            self._handle_input()
+            self.physics_engine.update()
+            self.enemy_manager.update(PHYSICS_STEP)
+            
+            self._check_sprite_collisions(PHYSICS_STEP)
+            self._check_hazard_collisions(PHYSICS_STEP)
         
-        self._check_coin_collisions()
-        self._check_enemy_collisions(delta_time)
-        self._check_hazard_collisions(delta_time)
+        self.player.update_animation(delta_time)
+        # Animate all hazards together
+        self.hazard_group.update(delta_time)
 
         if self._check_lose():
             from src.views.game_over_view import GameOverView
@@ -358,22 +475,14 @@ class GameView(arcade.View):
                     arcade.stop_sound(self.music_player)
                 except:
                     pass
-            if self.lose_sound:
-                try:
-                    arcade.play_sound(self.lose_sound, volume=0.8)
-                except:
-                    pass
+            self.play_lose()
             game_over = GameOverView(False, self.score, self.level_name)
             self.window.show_view(game_over)
             return
 
         if self._check_goal():
             from src.views.game_over_view import GameOverView
-            if self.win_sound:
-                try:
-                    arcade.play_sound(self.win_sound, volume=0.8)
-                except:
-                    pass
+            self.play_win()
             
             if self.level_index + 1 < len(LEVELS):
                 self.level_index += 1
@@ -398,11 +507,7 @@ class GameView(arcade.View):
         elif key in (arcade.key.W, arcade.key.UP, arcade.key.SPACE):
             if self.physics_engine.can_jump():
                 self.player.change_y = PLAYER_JUMP_SPEED
-                if self.jump_sound:
-                    try:
-                        arcade.play_sound(self.jump_sound, volume=0.4)
-                    except:
-                        pass
+                self.play_jump()
 
     def on_key_release(self, key, modifiers):
         if key in (arcade.key.A, arcade.key.LEFT):
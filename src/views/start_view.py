@@ -9,7 +9,37 @@ This module defines the StartView class which displays:
 
 import arcade
 import random
+from pyglet.graphics import Batch
 from config import SCREEN_WIDTH, SCREEN_HEIGHT
+from src.utils.ui_elements import make_particle_sprite, make_gradient_sprite, make_box_sprites
+
+# Gradient background colors, top band first
+BG_COLORS = (
+    (135, 206, 250),  # Light sky blue
+    (100, 180, 255),  # Medium sky blue
+    (70, 150, 255),   # Sky blue
+    (50, 120, 255),   # Deep sky blue
+    (30, 90, 255),    # Darker blue
+)
+
+# Instructions box geometry
+BOX_Y = SCREEN_HEIGHT * 0.4
+BOX_WIDTH = 600
+BOX_HEIGHT = 200
+
+# Size of the decorative orange corner squares
+CORNER_SIZE = 40
+
+# Instruction lines: (text, color, font size, bold)
+INSTRUCTIONS = (
+    ("🎮 CONTROLS 🎮", arcade.color.ORANGE, 20, True),
+    ("Arrow Keys / WASD - Move", arcade.color.BLACK, 16, False),
+    ("Space - Jump", arcade.color.BLACK, 16, False),
+    ("", arcade.color.BLACK, 16, False),
+    ("🎯 OBJECTIVE 🎯", arcade.color.ORANGE, 20, True),
+    ("Collect all coins 🪙 and reach the flag 🚩", arcade.color.BLACK, 16, False),
+    ("Avoid enemies and hazards - 3 hits max! ❤️", arcade.color.RED, 16, False),
+)
 
 
 class StartView(arcade.View):
@@ -24,6 +54,30 @@ class StartView(arcade.View):
         """Initialize the start view with particle effects."""
         super().__init__()
         self.time = 0.0  # Time accumulator for animations
+        
+        # Gradient background as one screen-sized sprite
+        self._background = arcade.SpriteList()
+        self._background.append(make_gradient_sprite(BG_COLORS, SCREEN_WIDTH, SCREEN_HEIGHT))
+        
+        # Static decorations: instructions box (fill + border) and orange corners
+        self._static = arcade.SpriteList()
+        self._static.extend(make_box_sprites(
+            SCREEN_WIDTH / 2, BOX_Y, BOX_WIDTH, BOX_HEIGHT,
+            (255, 255, 255, 220),  # White semi-transparent background box
+            arcade.color.ORANGE,  # Orange border around box
+            4,
+        ))
+        half = CORNER_SIZE / 2
+        for x, y in (
+            (half, SCREEN_HEIGHT - half),
+            (SCREEN_WIDTH - half, SCREEN_HEIGHT - half),
+            (half, half),
+            (SCREEN_WIDTH - half, half),
+        ):
+            self._static.append(arcade.SpriteSolidColor(
+                CORNER_SIZE, CORNER_SIZE, x, y, arcade.color.ORANGE
+            ))
+        
         self.particles = []  # List of particle dictionaries for visual effects
         
         # Create 20 random particles for background animation
@@ -34,62 +88,30 @@ class StartView(arcade.View):
                 'speed': 20 + random.randint(0, 30),  # Random upward speed
                 'size': 2 + random.randint(0, 3)  # Random particle size
             })
-
-    def on_show(self):
-        """Called when this view is shown. Sets the background color."""
-        arcade.set_background_color(arcade.color.SKY_BLUE)
-
-    def on_draw(self):
-        """
-        Draw the start menu screen.
         
-        Renders:
-        - Gradient background (5 layers of blue shades)
-        - Floating particles
-        - Game title with animated shadow
-        - Instructions box
-        - Pulsing start prompt
-        - Decorative corner elements
-        """
-        self.clear()
-        
-        # Draw gradient background (5 horizontal bands)
-        for i in range(5):
-            y = SCREEN_HEIGHT - i * (SCREEN_HEIGHT / 5)
-            height = SCREEN_HEIGHT / 5
-            colors = [
-                (135, 206, 250),  # Light sky blue
-                (100, 180, 255),  # Medium sky blue
-                (70, 150, 255),   # Sky blue
-                (50, 120, 255),   # Deep sky blue
-                (30, 90, 255)     # Darker blue
-            ]
-            arcade.draw_lrbt_rectangle_filled(
-                0, SCREEN_WIDTH, y - height, y, colors[i]
-            )
-        
-        # Draw floating particles
+        # One sprite per particle, drawn in a single batch
+        self.particle_sprites = arcade.SpriteList()
         for p in self.particles:
-            arcade.draw_circle_filled(p['x'], p['y'], p['size'], 
-                                     (255, 255, 255, 150))
+            self.particle_sprites.append(
+                make_particle_sprite(p['x'], p['y'], p['size'], (255, 255, 255, 150))
+            )
         
-        # Draw game title with animated shadow effect
+        # Create text objects once; only the shadow position and glow size change per frame.
+        # Texts that never change are drawn together from one batch
+        self._text_batch = Batch()
+        self._batched_texts = []  # Keeps the batched labels alive
         title_y = SCREEN_HEIGHT * 0.7
-        
-        # Animated shadow offset for depth effect
-        shadow_offset = 4 + abs(int(self.time * 2) % 3)
-        arcade.draw_text(
+        self._title_shadow = arcade.Text(
             "PLATFORMER ADVENTURE",
-            SCREEN_WIDTH / 2 + shadow_offset,
-            title_y - shadow_offset,
+            SCREEN_WIDTH / 2 + 4,
+            title_y - 4,
             (0, 0, 0, 100),  # Semi-transparent black shadow
             font_size=54,
             anchor_x="center",
             bold=True,
         )
-        
         # Main title text
-        arcade.draw_text(
+        self._batched_texts.append(arcade.Text(
             "PLATFORMER ADVENTURE",
             SCREEN_WIDTH / 2,
             title_y,
@@ -97,10 +119,10 @@ class StartView(arcade.View):
             font_size=54,
             anchor_x="center",
             bold=True,
-        )
-        
+            batch=self._text_batch,
+        ))
         # Subtitle
-        arcade.draw_text(
+        self._batched_texts.append(arcade.Text(
             "Enhanced Edition",
             SCREEN_WIDTH / 2,
             title_y - 60,
@@ -108,73 +130,35 @@ class StartView(arcade.View):
             font_size=24,
             anchor_x="center",
             italic=True,
-        )
-        
-        # Draw instructions box
-        box_y = SCREEN_HEIGHT * 0.4
-        box_width = 600
-        box_height = 200
-        
-        # White semi-transparent background box
-        arcade.draw_lrbt_rectangle_filled(
-            SCREEN_WIDTH / 2 - box_width / 2,
-            SCREEN_WIDTH / 2 + box_width / 2,
-            box_y - box_height / 2,
-            box_y + box_height / 2,
-            (255, 255, 255, 220)
-        )
-        
-        # Orange border around box
-        arcade.draw_lrbt_rectangle_outline(
-            SCREEN_WIDTH / 2 - box_width / 2,
-            SCREEN_WIDTH / 2 + box_width / 2,
-            box_y - box_height / 2,
-            box_y + box_height / 2,
-            arcade.color.ORANGE,
-            4
-        )
-        
-        # Instruction text lines
-        instructions = [
-            ("🎮 CONTROLS 🎮", arcade.color.ORANGE, 20, True),
-            ("Arrow Keys / WASD - Move", arcade.color.BLACK, 16, False),
-            ("Space - Jump", arcade.color.BLACK, 16, False),
-            ("", arcade.color.BLACK, 16, False),
-            ("🎯 OBJECTIVE 🎯", arcade.color.ORANGE, 20, True),
-            ("Collect all coins 🪙 and reach the flag 🚩", arcade.color.BLACK, 16, False),
-            ("Avoid enemies and hazards - 3 hits max! ❤️", arcade.color.RED, 16, False),
-        ]
-        
-        # Draw each instruction line
-        y_offset = box_y + 70
-        for line, color, size, bold in instructions:
-            arcade.draw_text(
-                line,
-                SCREEN_WIDTH / 2,
-                y_offset,
-                color,
-                font_size=size,
-                anchor_x="center",
-                bold=bold,
-            )
+            batch=self._text_batch,
+        ))
+        
+        # One text object per instruction line (blank lines only add spacing)
+        y_offset = BOX_Y + 70
+        for line, color, size, bold in INSTRUCTIONS:
+            if line:
+                self._batched_texts.append(arcade.Text(
+                    line,
+                    SCREEN_WIDTH / 2,
+                    y_offset,
+                    color,
+                    font_size=size,
+                    anchor_x="center",
+                    bold=bold,
+                    batch=self._text_batch,
+                ))
             y_offset -= 26
         
-        # Pulsing start prompt with glow effect
-        pulse = abs(int(self.time * 3) % 2)
-        if pulse:
-            glow_size = 26 + int(self.time * 5) % 4
-            arcade.draw_text(
-                "Press ENTER or SPACE to Start",
-                SCREEN_WIDTH / 2,
-                SCREEN_HEIGHT * 0.15,
-                arcade.color.WHITE,
-                font_size=glow_size,
-                anchor_x="center",
-                bold=True,
-            )
-        
-        # Main start prompt text
-        arcade.draw_text(
+        self._prompt_glow = arcade.Text(
+            "Press ENTER or SPACE to Start",
+            SCREEN_WIDTH / 2,
+            SCREEN_HEIGHT * 0.15,
+            arcade.color.WHITE,
+            font_size=26,
+            anchor_x="center",
+            bold=True,
+        )
+        self._prompt = arcade.Text(
             "Press ENTER or SPACE to Start",
             SCREEN_WIDTH / 2,
             SCREEN_HEIGHT * 0.15,
@@ -183,25 +167,58 @@ class StartView(arcade.View):
             anchor_x="center",
             bold=True,
         )
+
+    def on_show(self):
+        """Called when this view is shown. Sets the background color."""
+        arcade.set_background_color(arcade.color.SKY_BLUE)
+
+    def on_draw(self):
+        """
+        Draw the start menu screen.
         
-        # Decorative orange corners
-        corner_size = 40
-        arcade.draw_lrbt_rectangle_filled(
-            0, corner_size, SCREEN_HEIGHT - corner_size, SCREEN_HEIGHT, 
-            arcade.color.ORANGE
-        )
-        arcade.draw_lrbt_rectangle_filled(
-            SCREEN_WIDTH - corner_size, SCREEN_WIDTH, 
-            SCREEN_HEIGHT - corner_size, SCREEN_HEIGHT, 
-            arcade.color.ORANGE
-        )
-        arcade.draw_lrbt_rectangle_filled(
-            0, corner_size, 0, corner_size, arcade.color.ORANGE
-        )
-        arcade.draw_lrbt_rectangle_filled(
-            SCREEN_WIDTH - corner_size, SCREEN_WIDTH, 0, corner_size, 
-            arcade.color.ORANGE
+        Renders:
+        - Gradient background (5 layers of blue shades)
+        - Floating particles
+        - Game title with animated shadow
+        - Instructions box
+        - Pulsing start prompt
+        - Decorative corner elements
+        """
+        self.clear()
+        
+        # Animation phases for this frame, computed once
+        t = self.time
+        shadow_offset = 4 + int(t * 2) % 3  # Title shadow depth
+        pulse = int(t * 3) & 1  # Start prompt glow visibility
+        glow_size = 26 + (int(t * 5) & 3)
+        
+        # Draw gradient background (5 horizontal bands, one sprite)
+        self._background.draw(pixelated=True)
+        
+        # Draw floating particles
+        self.particle_sprites.draw()
+        
+        # Draw instructions box and decorative corners
+        self._static.draw()
+        
+        # Animated title shadow offset for depth effect
+        self._title_shadow.position = (
+            SCREEN_WIDTH / 2 + shadow_offset,
+            SCREEN_HEIGHT * 0.7 - shadow_offset,
         )
+        self._title_shadow.draw()
+        
+        # Title, subtitle and instruction lines
+        self._text_batch.draw()
+        
+        # Pulsing start prompt with glow effect
+        if pulse:
+            if self._prompt_glow.font_size != glow_size:
+                self._prompt_glow.font_size = glow_size
+            self._prompt_glow.draw()
+        
+        # Main start prompt text
+        self._prompt.draw()
 
     def on_update(self, delta_time: float):
         """
@@ -213,12 +230,13 @@ class StartView(arcade.View):
         self.time += delta_time
         
         # Update particle positions (move upward)
-        for p in self.particles:
+        for p, sprite in zip(self.particles, self.particle_sprites):
             p['y'] += p['speed'] * delta_time
             # Reset particle to bottom when it goes off screen
             if p['y'] > SCREEN_HEIGHT:
                 p['y'] = 0
                 p['x'] = random.randint(0, SCREEN_WIDTH)
+            sprite.position = p['x'], p['y']
 
     def on_key_press(self, key, modifiers):
         """